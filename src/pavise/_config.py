@@ -0,0 +1,8 @@
+"""Runtime configuration read from environment variables at import time."""
+
+import os
+
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+# Set PAVISE_VALIDATE=0 (or false/no/off) to skip runtime validation in DataFrame[Schema](...)
+VALIDATE_ENABLED = os.environ.get("PAVISE_VALIDATE", "1").strip().lower() not in _FALSE_VALUES
@@ -1,11 +1,13 @@
 """Schema column specification for Pandas backend."""
 
 from dataclasses import dataclass
-from typing import Literal, Union, get_args, get_origin, get_type_hints
+from typing import Literal, Union, get_args, get_origin
 
 import pandas as pd
 
-from .validation import INDEX_COLUMN_NAME, TYPE_TO_DTYPE, _extract_type_and_validators
+from pavise._schema import extract_type_and_validators, get_schema_type_hints
+
+from .validation import INDEX_COLUMN_NAME, TYPE_TO_DTYPE
 
 
 @dataclass
@@ -45,7 +47,7 @@ def get_column_specs(schema: type) -> dict[str, ColumnSpec]:
         Dict mapping column_name -> ColumnSpec (excluding INDEX_COLUMN_NAME)
     """
 
-    type_hints = get_type_hints(schema, include_extras=True)
+    type_hints = get_schema_type_hints(schema)
     specs = {}
 
     for col_name, col_type in type_hints.items():
@@ -53,9 +55,7 @@ def get_column_specs(schema: type) -> dict[str, ColumnSpec]:
         if col_name == INDEX_COLUMN_NAME:
             continue
 
-        base_type, _validators, is_optional, is_not_required = _extract_type_and_validators(
-            col_type
-        )
+        base_type, _validators, is_optional, is_not_required = extract_type_and_validators(col_type)
 
         # Resolve Literal types
         if get_origin(base_type) is Literal:
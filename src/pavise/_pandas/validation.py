@@ -6,20 +6,20 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import (
     Annotated,
+    Any,
     Callable,
     Literal,
     Union,
     get_args,
     get_origin,
-    get_type_hints,
 )
 
 import numpy as np
 import pandas as pd
 
+from pavise._schema import extract_type_and_validators, get_required_columns
 from pavise.exceptions import ValidationError
 from pavise.testing import ANY
-from pavise.types import NotRequiredColumn
 
 # Special column name for index validation
 INDEX_COLUMN_NAME = "__index__"
@@ -88,80 +88,57 @@ TYPE_TO_DTYPE = {
 }
 
 
-def validate_dataframe(df: pd.DataFrame, schema: type, strict: bool = False) -> None:
-    """
-    Validate that a DataFrame conforms to a Protocol schema.
+# Validator specialized for one schema: (df, strict) -> None, raising ValidationError
+SchemaValidator = Callable[[pd.DataFrame, bool], None]
 
-    Args:
-        df: DataFrame to validate
-        schema: Protocol type defining the expected schema
-        strict: If True, raise error on extra columns not in schema
 
-    Raises:
-        ValueError: If a required column is missing or type is unsupported
-        TypeError: If a column has the wrong type
+def build_schema_validator(type_hints: dict[str, Any]) -> SchemaValidator:
     """
-    expected_cols = get_type_hints(schema, include_extras=True)
+    Build a validator function specialized for a schema.
 
-    for col_name, col_type in expected_cols.items():
-        if col_name == INDEX_COLUMN_NAME:
-            _check_index_type(df, col_type)
-        else:
-            is_not_required = isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn)
-            if is_not_required and col_name not in df.columns:
-                continue
-            _check_column_exists(df, col_name)
-            _check_column_type(df, col_name, col_type)
-
-    if strict:
-        schema_cols = set(expected_cols.keys())
-        if INDEX_COLUMN_NAME in schema_cols:
-            schema_cols.remove(INDEX_COLUMN_NAME)
-        df_cols = set(df.columns)
-        extra_cols = df_cols - schema_cols
-        if extra_cols:
-            raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
-
-
-def _extract_type_and_validators(annotation: type) -> tuple[type, list, bool, bool]:
-    """
-    Extract base type, validators, nullable flag, and not-required flag from a type annotation.
+    Annotations are decomposed and type checkers are resolved here, once, so that the
+    returned function only performs the checks that depend on the DataFrame itself.
 
     Args:
-        annotation: Type annotation (e.g., int, Optional[int], NotRequiredColumn[int],
-            or Annotated[int, Range(0, 100)])
+        type_hints: Resolved annotations of the schema (column_name -> annotation)
 
     Returns:
-        Tuple of (base_type, validators, is_optional, is_not_required)
-        - For Annotated[int, Range(0, 100)]: (int, [Range(0, 100)], False, False)
-        - For int: (int, [], False, False)
-        - For Optional[int]: (int, [], True, False)
-        - For NotRequiredColumn[int]: (int, [], False, True)
-        - For NotRequiredColumn[Optional[int]]: (int, [], True, True)
+        Function taking (df, strict) that raises ValidationError if df does not conform
     """
-    validators = []
-    is_optional = False
-    is_not_required = False
+    index_type = type_hints.get(INDEX_COLUMN_NAME)
+    # (column name, check) pairs in schema order, iterated as a flat tuple on every call
+    validation_plan = tuple(
+        (col_name, _build_column_check(col_name, col_type))
+        for col_name, col_type in type_hints.items()
+        if col_name != INDEX_COLUMN_NAME
+    )
+    schema_cols = frozenset(type_hints) - {INDEX_COLUMN_NAME}
+    required_cols = tuple(
+        col_name for col_name in get_required_columns(type_hints) if col_name != INDEX_COLUMN_NAME
+    )
+    required_col_set = frozenset(required_cols)
 
-    if isinstance(annotation, type) and issubclass(annotation, NotRequiredColumn):
-        is_not_required = True
-        annotation = getattr(annotation, "_inner_type", annotation)
+    def validate(df: pd.DataFrame, strict: bool = False) -> None:
+        df_cols = frozenset(df.columns)
+        # Subset test runs in C; only look for the offending column once one is missing
+        if not required_col_set <= df_cols:
+            missing_col = next(col_name for col_name in required_cols if col_name not in df_cols)
+            raise ValidationError("missing", column_name=missing_col)
 
-    if get_origin(annotation) is Annotated:
-        args = get_args(annotation)
-        base_type = args[0]
-        validators = list(args[1:])
-        annotation = base_type
+        if index_type is not None:
+            _check_index_type(df, index_type)
 
-    origin = get_origin(annotation)
-    if origin is Union:
-        args = get_args(annotation)
-        if len(args) == 2 and type(None) in args:
-            is_optional = True
-            base_type = args[0] if args[1] is type(None) else args[1]
-            return base_type, validators, is_optional, is_not_required
+        for col_name, check in validation_plan:
+            # Required columns were checked up front, so an absent column is a NotRequiredColumn
+            if col_name in df_cols:
+                check(df[col_name])
 
-    return annotation, validators, is_optional, is_not_required
+        if strict:
+            extra_cols = df_cols - schema_cols
+            if extra_cols:
+                raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
+
+    return validate
 
 
 def _extract_index_name_type_and_validators(
@@ -286,75 +263,96 @@ def _check_multiindex_type(
                 apply_validator(level_series, validator, f"Index level {level_idx}")
 
 
-def _check_column_exists(df: pd.DataFrame, col_name: str) -> None:
-    """Check if a column exists in the DataFrame."""
-    if col_name not in df.columns:
-        raise ValidationError("missing", column_name=col_name)
+def _build_column_check(col_name: str, expected_type: type) -> Callable[[pd.Series], None]:
+    """Build a function checking one schema column, given its series."""
+    from pavise._pandas.validator_impl import get_validator_handler
 
+    base_type, validators, is_optional, _is_not_required = extract_type_and_validators(
+        expected_type
+    )
+    check_type = _build_type_check(col_name, base_type, is_optional)
+    validator_handlers = tuple(
+        (get_validator_handler(validator), validator) for validator in validators
+    )
 
-def _check_column_type(df: pd.DataFrame, col_name: str, expected_type: type) -> None:
-    """Check if a column has the expected type and apply validators."""
-    from pavise._pandas.validator_impl import apply_validator
+    def check_column(series: pd.Series) -> None:
+        if _is_placeholder_column(series):
+            return
 
-    # Skip validation if all values in column are ANY sentinel
-    if all(value is ANY for value in df[col_name]):
-        return
+        check_type(series)
+        for handler, validator in validator_handlers:
+            handler(series, validator, col_name)
+
+    return check_column
+
+
+def _is_placeholder_column(series: pd.Series) -> bool:
+    """Check if a column is empty or holds only ANY sentinels, so it is not validated."""
+    if series.empty:
+        return True
+    # ANY can only be stored in object columns; other dtypes skip the per-value scan
+    return series.dtype == object and all(value is ANY for value in series)
 
-    base_type, validators, is_optional, _is_not_required = _extract_type_and_validators(
-        expected_type
-    )
 
+def _build_type_check(
+    col_name: str, base_type: type, is_optional: bool
+) -> Callable[[pd.Series], None]:
+    """Build a function checking that a column has the expected type."""
     if isinstance(base_type, type) and issubclass(base_type, pd.api.extensions.ExtensionDtype):
-        col_dtype = df[col_name].dtype
-        if type(col_dtype) is not base_type:
-            base_tname = base_type.__name__
-            col_tname = type(col_dtype).__name__
-            raise ValidationError(
-                f"expected {base_tname}, got {col_tname}",
-                column_name=col_name,
-            )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        base_tname = base_type.__name__
+
+        def check_extension_dtype(series: pd.Series) -> None:
+            if type(series.dtype) is not base_type:
+                raise ValidationError(
+                    f"expected {base_tname}, got {type(series.dtype).__name__}",
+                    column_name=col_name,
+                )
+
+        return check_extension_dtype
 
     if get_origin(base_type) is Literal:
         allowed_values = get_args(base_type)
-        invalid_mask = ~df[col_name].isin(allowed_values)
-        if invalid_mask.any():
-            invalid_df = df[col_name][invalid_mask]
+
+        def check_literal(series: pd.Series) -> None:
+            invalid_mask = ~series.isin(allowed_values)
+            if invalid_mask.any():
+                invalid_df = series[invalid_mask]
+                samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
+                samples = samples[:MAX_SAMPLE_SIZE]
+                raise ValidationError.new_with_samples(
+                    col_name,
+                    f"expected one of {allowed_values}, got invalid values",
+                    samples,
+                    len(invalid_df),
+                    repr,
+                )
+
+        return check_literal
+
+    if base_type not in TYPE_CHECKERS:
+
+        def check_unsupported(series: pd.Series) -> None:
+            raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
+
+        return check_unsupported
+
+    checker = TYPE_CHECKERS[base_type]
+    dtype_ok = checker.dtype
+
+    def check_builtin(series: pd.Series) -> None:
+        if not is_optional and series.isna().any():
+            raise ValidationError("is non-optional but contains null values", column_name=col_name)
+        if not dtype_ok(series):
+            invalid_mask = series.apply(checker.value)
+            invalid_df = series[~invalid_mask]
             samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
             samples = samples[:MAX_SAMPLE_SIZE]
             raise ValidationError.new_with_samples(
                 col_name,
-                f"expected one of {allowed_values}, got invalid values",
+                f"expected {base_type.__name__}, got {series.dtype}",
                 samples,
                 len(invalid_df),
                 repr,
             )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
-
-    if base_type not in TYPE_CHECKERS:
-        raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
-
-    checker = TYPE_CHECKERS[base_type]
-    col_dtype = df[col_name].dtype
-
-    if not is_optional and df[col_name].isna().any():
-        raise ValidationError("is non-optional but contains null values", column_name=col_name)
-    if not checker.dtype(df[col_name]):
-        invalid_mask = df[col_name].apply(checker.value)
-        invalid_df = df[col_name][~invalid_mask]
-        samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
-        samples = samples[:MAX_SAMPLE_SIZE]
-        raise ValidationError.new_with_samples(
-            col_name,
-            f"expected {base_type.__name__}, got {col_dtype}",
-            samples,
-            len(df[col_name][~invalid_mask]),
-            repr,
-        )
 
-    for validator in validators:
-        apply_validator(df[col_name], validator, col_name)
+    return check_builtin
@@ -1,7 +1,10 @@
 """Pandas-specific validator implementations."""
 
-from typing import Any
+from __future__ import annotations
 
+from typing import Any, Callable
+
+import numpy as np
 import pandas as pd
 
 from pavise.exceptions import ValidationError
@@ -23,22 +26,32 @@ def apply_validator(series: pd.Series, validator: Any, col_name: str) -> None:
     Raises:
         ValueError: if validation fails
     """
-    if isinstance(validator, Range):
-        _validate_range(series, validator, col_name)
-    elif isinstance(validator, Unique):
-        _validate_unique(series, col_name)
-    elif isinstance(validator, In):
-        _validate_in(series, validator, col_name)
-    elif isinstance(validator, Regex):
-        _validate_regex(series, validator, col_name)
-    elif isinstance(validator, MinLen):
-        _validate_minlen(series, validator, col_name)
-    elif isinstance(validator, MaxLen):
-        _validate_maxlen(series, validator, col_name)
-    elif isinstance(validator, Custom):
-        _validate_custom(series, validator, col_name)
-    else:
-        raise ValidationError(f"Unknown validator type: {type(validator)}")
+    get_validator_handler(validator)(series, validator, col_name)
+
+
+def get_validator_handler(validator: Any) -> Callable[[Any, Any, str], None]:
+    """
+    Get the function implementing a validator.
+
+    Handlers are looked up by the validator's class, then its bases for subclasses.
+    Callers applying the same validator repeatedly can resolve its handler once.
+
+    Args:
+        validator: Validator instance (e.g., Range, Unique, In, Regex, MinLen, MaxLen)
+
+    Returns:
+        Handler taking (series, validator, col_name); raises for unknown validator types
+    """
+    for validator_type in type(validator).__mro__:
+        handler = _VALIDATOR_HANDLERS.get(validator_type)
+        if handler is not None:
+            return handler
+    return _raise_unknown_validator
+
+
+def _raise_unknown_validator(series: pd.Series, validator: Any, col_name: str) -> None:
+    """Raise for a validator that has no implementation in this backend."""
+    raise ValidationError(f"Unknown validator type: {type(validator)}")
 
 
 def _get_invalid_samples(series: pd.Series, invalid_mask: pd.Series) -> tuple[list[tuple], int]:
@@ -58,12 +71,45 @@ def _get_invalid_samples(series: pd.Series, invalid_mask: pd.Series) -> tuple[li
     return samples, total_invalid
 
 
+def _get_min_max(series: pd.Series) -> tuple[Any, Any] | None:
+    """
+    Get the minimum and maximum of the non-null values in a Series.
+
+    Plain NumPy int/float columns are reduced on the underlying array, skipping pandas'
+    reduction machinery; other dtypes fall back to Series.min()/max().
+
+    Args:
+        series: pandas Series to reduce
+
+    Returns:
+        Tuple of (min, max), or None if the Series has no non-null values
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf":
+        arr = series.to_numpy(copy=False)
+        if arr.size == 0:
+            return None
+        col_min, col_max = arr.min(), arr.max()
+        # NaN propagates through min()/max(); redo the reductions ignoring it
+        if np.isnan(col_min):
+            if np.isnan(arr).all():
+                return None
+            col_min, col_max = np.nanmin(arr), np.nanmax(arr)
+        return col_min, col_max
+
+    col_min = series.min()
+    if pd.isna(col_min):
+        return None
+    return col_min, series.max()
+
+
 def _validate_range(series: pd.Series, validator: Range, col_name: str) -> None:
     """Validate that all values in series are within the specified range."""
-    invalid_mask = (series < validator.min) | (series > validator.max)
-    if not invalid_mask.any():
+    # Two reductions decide the common all-valid case without allocating boolean masks
+    bounds = _get_min_max(series)
+    if bounds is None or (bounds[0] >= validator.min and bounds[1] <= validator.max):
         return
 
+    invalid_mask = (series < validator.min) | (series > validator.max)
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(
         col_name,
@@ -74,7 +120,7 @@ def _validate_range(series: pd.Series, validator: Range, col_name: str) -> None:
     )
 
 
-def _validate_unique(series: pd.Series, col_name: str) -> None:
+def _validate_unique(series: pd.Series, validator: Unique, col_name: str) -> None:
     """Validate that all values in series are unique (no duplicates)."""
     duplicated_mask = series.duplicated(keep=False)
     if not duplicated_mask.any():
@@ -154,3 +200,14 @@ def _validate_custom(series: pd.Series, validator: Custom, col_name: str) -> Non
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(col_name, validator.message, samples, total_invalid)
+
+
+_VALIDATOR_HANDLERS: dict[type, Callable[[Any, Any, str], None]] = {
+    Range: _validate_range,
+    Unique: _validate_unique,
+    In: _validate_in,
+    Regex: _validate_regex,
+    MinLen: _validate_minlen,
+    MaxLen: _validate_maxlen,
+    Custom: _validate_custom,
+}
@@ -1,13 +1,15 @@
 """Schema column specification for Polars backend."""
 
 from dataclasses import dataclass
-from typing import Literal, get_args, get_origin, get_type_hints
+from typing import Literal, get_args, get_origin
 
 try:
     import polars as pl
 except ImportError:
     raise ImportError("Polars is not installed. Install it with: pip install pavise[polars]")
 
+from pavise._schema import extract_type_and_validators, get_schema_type_hints
+
 from .validation import TYPE_TO_DTYPE
 
 
@@ -47,15 +49,11 @@ def get_column_specs(schema: type) -> dict[str, ColumnSpec]:
     Returns:
         Dict mapping column_name -> ColumnSpec
     """
-    from pavise._polars.validation import _extract_type_and_validators
-
-    type_hints = get_type_hints(schema, include_extras=True)
+    type_hints = get_schema_type_hints(schema)
     specs = {}
 
     for col_name, col_type in type_hints.items():
-        base_type, _validators, is_optional, is_not_required = _extract_type_and_validators(
-            col_type
-        )
+        base_type, _validators, is_optional, is_not_required = extract_type_and_validators(col_type)
 
         # Resolve Literal types
         if get_origin(base_type) is Literal:
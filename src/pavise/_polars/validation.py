@@ -5,23 +5,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import (
-    Annotated,
+    Any,
     Callable,
     Literal,
-    Union,
     get_args,
     get_origin,
-    get_type_hints,
 )
 
 from pavise.testing import ANY
-from pavise.types import NotRequiredColumn
 
 try:
     import polars as pl
 except ImportError:
     raise ImportError("Polars is not installed. Install it with: pip install pavise[polars]")
 
+from pavise._schema import extract_type_and_validators, get_required_columns
 from pavise.exceptions import ValidationError
 
 # Maximum number of invalid sample values to show in error messages
@@ -34,47 +32,50 @@ MAX_CHECK_ROWS = 100
 class TypeChecker:
     """Type checker with both dtype-level and value-level validation."""
 
-    dtype: Callable  # Check dtype
+    dtype: Callable[[type[pl.DataType]], bool]  # Check base type of dtype (dtype.base_type())
     value: Callable[[object], bool]  # Check individual values
 
 
-def _is_datetime_dtype(dtype):
-    """Check if dtype is a Datetime type (with any time unit)."""
-    if dtype == pl.Datetime:
-        return True
-    if hasattr(dtype, "time_unit"):
-        return True
-    return False
+# Base types accepted for each Python type. Comparing dtype.base_type() against these
+# sets is a hash lookup, and ignores parameters such as Datetime time unit/time zone.
+_INT_BASE_TYPES = frozenset(
+    {pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64}
+)
+_FLOAT_BASE_TYPES = frozenset({pl.Float32, pl.Float64})
+_STR_BASE_TYPES = frozenset({pl.Utf8})
+_BOOL_BASE_TYPES = frozenset({pl.Boolean})
+_DATETIME_BASE_TYPES = frozenset({pl.Datetime})
+_DATE_BASE_TYPES = frozenset({pl.Date})
+_DURATION_BASE_TYPES = frozenset({pl.Duration})
 
 
 TYPE_CHECKERS = {
     int: TypeChecker(
-        dtype=lambda dtype: dtype
-        in (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64),
+        dtype=_INT_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, int) and not isinstance(x, bool),
     ),
     float: TypeChecker(
-        dtype=lambda dtype: dtype in (pl.Float32, pl.Float64),
+        dtype=_FLOAT_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, (int, float)) and not isinstance(x, bool),
     ),
     str: TypeChecker(
-        dtype=lambda dtype: dtype == pl.Utf8,
+        dtype=_STR_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, str),
     ),
     bool: TypeChecker(
-        dtype=lambda dtype: dtype == pl.Boolean,
+        dtype=_BOOL_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, bool),
     ),
     datetime: TypeChecker(
-        dtype=_is_datetime_dtype,
+        dtype=_DATETIME_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, datetime),
     ),
     date: TypeChecker(
-        dtype=lambda dtype: dtype == pl.Date,
+        dtype=_DATE_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, date),
     ),
     timedelta: TypeChecker(
-        dtype=lambda dtype: dtype == pl.Duration,
+        dtype=_DURATION_BASE_TYPES.__contains__,
         value=lambda x: isinstance(x, timedelta),
     ),
 }
@@ -91,83 +92,80 @@ TYPE_TO_DTYPE = {
 }
 
 
-def validate_dataframe(df: pl.DataFrame, schema: type, strict: bool = False) -> None:
-    """
-    Validate that a Polars DataFrame conforms to a Protocol schema.
+# Validator specialized for one schema: (df, strict) -> None, raising ValidationError
+SchemaValidator = Callable[[pl.DataFrame, bool], None]
 
-    Args:
-        df: Polars DataFrame to validate
-        schema: Protocol type defining the expected schema
-        strict: If True, raise error on extra columns not in schema
 
-    Raises:
-        ValueError: If a required column is missing or type is unsupported
-        TypeError: If a column has the wrong type
+def build_schema_validator(type_hints: dict[str, Any]) -> SchemaValidator:
     """
-    expected_cols = get_type_hints(schema, include_extras=True)
-
-    for col_name, col_type in expected_cols.items():
-        is_not_required = isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn)
-        if is_not_required and col_name not in df.columns:
-            continue
-        _check_column_exists(df, col_name)
-        _check_column_type(df, col_name, col_type)
-
-    if strict:
-        schema_cols = set(expected_cols.keys())
-        df_cols = set(df.columns)
-        extra_cols = df_cols - schema_cols
-        if extra_cols:
-            raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
+    Build a validator function specialized for a schema.
 
-
-def _extract_type_and_validators(annotation: type) -> tuple[type, list, bool, bool]:
-    """
-    Extract base type, validators, nullable flag, and not-required flag from a type annotation.
+    Annotations are decomposed and type checkers are resolved here, once, so that the
+    returned function only performs the checks that depend on the DataFrame itself.
 
     Args:
-        annotation: Type annotation (e.g., int, Optional[int], NotRequiredColumn[int],
-            or Annotated[int, Range(0, 100)])
+        type_hints: Resolved annotations of the schema (column_name -> annotation)
 
     Returns:
-        Tuple of (base_type, validators, is_optional, is_not_required)
-        - For Annotated[int, Range(0, 100)]: (int, [Range(0, 100)], False, False)
-        - For int: (int, [], False, False)
-        - For Optional[int]: (int, [], True, False)
-        - For NotRequiredColumn[int]: (int, [], False, True)
-        - For NotRequiredColumn[Optional[int]]: (int, [], True, True)
+        Function taking (df, strict) that raises ValidationError if df does not conform
     """
-    validators = []
-    is_optional = False
-    is_not_required = False
-
-    if isinstance(annotation, type) and issubclass(annotation, NotRequiredColumn):
-        is_not_required = True
-        annotation = getattr(annotation, "_inner_type", annotation)
-
-    if get_origin(annotation) is Annotated:
-        args = get_args(annotation)
-        base_type = args[0]
-        validators = list(args[1:])
-        annotation = base_type
-
-    origin = get_origin(annotation)
-    if origin is Union:
-        args = get_args(annotation)
-        if len(args) == 2 and type(None) in args:
-            is_optional = True
-            base_type = args[0] if args[1] is type(None) else args[1]
-            return base_type, validators, is_optional, is_not_required
+    # (column name, check) pairs in schema order, iterated as a flat tuple on every call
+    validation_plan = tuple(
+        (col_name, _build_column_check(col_name, col_type))
+        for col_name, col_type in type_hints.items()
+    )
+    schema_cols = frozenset(type_hints)
+    required_cols = get_required_columns(type_hints)
+    required_col_set = frozenset(required_cols)
+
+    def validate(df: pl.DataFrame, strict: bool = False) -> None:
+        # df.schema builds a dtype object for every column of the frame; the names are much
+        # cheaper on wide frames, and dtypes are only read for the schema's own columns
+        df_cols = frozenset(df.columns)
+        # Subset test runs in C; only look for the offending column once one is missing
+        if not required_col_set <= df_cols:
+            missing_col = next(col_name for col_name in required_cols if col_name not in df_cols)
+            raise ValidationError("missing", column_name=missing_col)
+
+        for col_name, check in validation_plan:
+            # Required columns were checked up front, so an absent column is a NotRequiredColumn
+            if col_name in df_cols:
+                series = df.get_column(col_name)
+                check(series, series.dtype)
+
+        if strict:
+            extra_cols = df_cols - schema_cols
+            if extra_cols:
+                raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
+
+    return validate
+
+
+def has_only_dtype_checks(type_hints: dict[str, Any]) -> bool:
+    """
+    Check if every column check of a schema depends only on the column dtype.
 
-    return annotation, validators, is_optional, is_not_required
+    That is the case for nullable builtin types and polars DataType annotations without
+    validators. Validators, Literal and the null check of non-optional columns look at
+    values, which polars can change in place without changing any dtype.
+    """
+    for col_type in type_hints.values():
+        base_type, validators, is_optional, _is_not_required = extract_type_and_validators(col_type)
+        if validators:
+            return False
+        if isinstance(base_type, type) and issubclass(base_type, pl.DataType):
+            continue
+        if not (is_optional and base_type in TYPE_CHECKERS):
+            return False
+    return True
 
 
 def _raise_type_error_with_samples(
-    df: pl.DataFrame, col_name: str, checker: TypeChecker, expected_type: type, actual_dtype
+    series: pl.Series, col_name: str, checker: TypeChecker, expected_type: type, actual_dtype
 ) -> None:
     """Raise TypeError with sample invalid values."""
-    invalid_mask = df[col_name].map_elements(lambda v: not checker.value(v))
-    invalid_df = df[col_name].to_frame().with_row_index("__row__").filter(invalid_mask)
+    invalid_mask = series.map_elements(lambda v: not checker.value(v))
+    invalid_df = series.to_frame().with_row_index("__row__").filter(invalid_mask)
     samples = [
         (row["__row__"], row[col_name])
         for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
@@ -182,66 +180,92 @@ def _raise_type_error_with_samples(
     )
 
 
-def _check_column_exists(df: pl.DataFrame, col_name: str) -> None:
-    """Check if a column exists in the DataFrame."""
-    if col_name not in df.columns:
-        raise ValidationError("missing", column_name=col_name)
+def _build_column_check(
+    col_name: str, expected_type: type
+) -> Callable[[pl.Series, pl.DataType], None]:
+    """Build a function checking one schema column, given its series and dtype."""
+    from pavise._polars.validator_impl import get_validator_handler
+
+    base_type, validators, is_optional, _is_not_required = extract_type_and_validators(
+        expected_type
+    )
+    check_type = _build_type_check(col_name, base_type, is_optional)
+    validator_handlers = tuple(
+        (get_validator_handler(validator), validator) for validator in validators
+    )
+
+    def check_column(series: pl.Series, col_dtype: pl.DataType) -> None:
+        if _is_placeholder_column(series, col_dtype):
+            return
 
+        check_type(series, col_dtype)
+        for handler, validator in validator_handlers:
+            handler(series, validator, col_name)
 
-def _check_column_type(df: pl.DataFrame, col_name: str, expected_type: type) -> None:
-    """Check if a column has the expected type and apply validators."""
-    from pavise._polars.validator_impl import apply_validator
+    return check_column
 
-    # Skip validation if all values in column are ANY sentinel
-    if all(value is ANY for value in df[col_name]):
-        return
 
-    base_type, validators, is_optional, _is_not_required = _extract_type_and_validators(
-        expected_type
-    )
+def _is_placeholder_column(series: pl.Series, col_dtype: pl.DataType) -> bool:
+    """Check if a column is empty or holds only ANY sentinels, so it is not validated."""
+    if series.is_empty():
+        return True
+    # ANY can only be stored in Object columns; other dtypes skip the per-value scan
+    return col_dtype.base_type() is pl.Object and all(value is ANY for value in series)
+
 
+def _build_type_check(
+    col_name: str, base_type: type, is_optional: bool
+) -> Callable[[pl.Series, pl.DataType], None]:
+    """Build a function checking that a column has the expected type."""
     if isinstance(base_type, type) and issubclass(base_type, pl.DataType):
-        col_dtype = df[col_name].dtype
-        if col_dtype != base_type:
-            raise ValidationError(
-                f"expected {base_type.__name__}, got {col_dtype}",
-                column_name=col_name,
-            )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+
+        def check_polars_dtype(series: pl.Series, col_dtype: pl.DataType) -> None:
+            if col_dtype != base_type:
+                raise ValidationError(
+                    f"expected {base_type.__name__}, got {col_dtype}",
+                    column_name=col_name,
+                )
+
+        return check_polars_dtype
 
     if get_origin(base_type) is Literal:
         allowed_values = get_args(base_type)
-        invalid_mask = ~df[col_name].is_in(allowed_values)
-        if invalid_mask.any():
-            invalid_df = df[col_name].to_frame().with_row_index("__row__").filter(invalid_mask)
-            samples = [
-                (row["__row__"], row[col_name])
-                for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
-            ]
-            total_invalid = int(invalid_mask.sum())
-            raise ValidationError.new_with_samples(
-                col_name,
-                f"expected one of {allowed_values}, got invalid values",
-                samples,
-                total_invalid,
-                repr,
-            )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+
+        def check_literal(series: pl.Series, col_dtype: pl.DataType) -> None:
+            invalid_mask = ~series.is_in(allowed_values)
+            if invalid_mask.any():
+                invalid_df = series.to_frame().with_row_index("__row__").filter(invalid_mask)
+                samples = [
+                    (row["__row__"], row[col_name])
+                    for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
+                ]
+                total_invalid = int(invalid_mask.sum())
+                raise ValidationError.new_with_samples(
+                    col_name,
+                    f"expected one of {allowed_values}, got invalid values",
+                    samples,
+                    total_invalid,
+                    repr,
+                )
+
+        return check_literal
 
     if base_type not in TYPE_CHECKERS:
-        raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
+
+        def check_unsupported(series: pl.Series, col_dtype: pl.DataType) -> None:
+            raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
+
+        return check_unsupported
 
     checker = TYPE_CHECKERS[base_type]
-    col_dtype = df[col_name].dtype
-    if not checker.dtype(col_dtype):
-        _raise_type_error_with_samples(df, col_name, checker, base_type, col_dtype)
+    # Bound frozenset.__contains__ of the accepted base types, looked up once per column
+    dtype_ok = checker.dtype
+
+    def check_builtin(series: pl.Series, col_dtype: pl.DataType) -> None:
+        if not dtype_ok(col_dtype.base_type()):
+            _raise_type_error_with_samples(series, col_name, checker, base_type, col_dtype)
 
-    if not is_optional and df[col_name].null_count() > 0:
-        raise ValidationError("is non-optional but contains null values", column_name=col_name)
+        if not is_optional and series.null_count() > 0:
+            raise ValidationError("is non-optional but contains null values", column_name=col_name)
 
-    for validator in validators:
-        apply_validator(df[col_name], validator, col_name)
+    return check_builtin
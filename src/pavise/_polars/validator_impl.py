@@ -1,6 +1,6 @@
 """Polars-specific validator implementations."""
 
-from typing import Any
+from typing import Any, Callable
 
 try:
     import polars as pl
@@ -26,22 +26,32 @@ def apply_validator(series: "pl.Series", validator: Any, col_name: str) -> None:
     Raises:
         ValueError: if validation fails
     """
-    if isinstance(validator, Range):
-        _validate_range(series, validator, col_name)
-    elif isinstance(validator, Unique):
-        _validate_unique(series, col_name)
-    elif isinstance(validator, In):
-        _validate_in(series, validator, col_name)
-    elif isinstance(validator, Regex):
-        _validate_regex(series, validator, col_name)
-    elif isinstance(validator, MinLen):
-        _validate_minlen(series, validator, col_name)
-    elif isinstance(validator, MaxLen):
-        _validate_maxlen(series, validator, col_name)
-    elif isinstance(validator, Custom):
-        _validate_custom(series, validator, col_name)
-    else:
-        raise ValidationError(f"Unknown validator type: {type(validator)}")
+    get_validator_handler(validator)(series, validator, col_name)
+
+
+def get_validator_handler(validator: Any) -> Callable[[Any, Any, str], None]:
+    """
+    Get the function implementing a validator.
+
+    Handlers are looked up by the validator's class, then its bases for subclasses.
+    Callers applying the same validator repeatedly can resolve its handler once.
+
+    Args:
+        validator: Validator instance (e.g., Range, Unique, In, Regex, MinLen, MaxLen)
+
+    Returns:
+        Handler taking (series, validator, col_name); raises for unknown validator types
+    """
+    for validator_type in type(validator).__mro__:
+        handler = _VALIDATOR_HANDLERS.get(validator_type)
+        if handler is not None:
+            return handler
+    return _raise_unknown_validator
+
+
+def _raise_unknown_validator(series: "pl.Series", validator: Any, col_name: str) -> None:
+    """Raise for a validator that has no implementation in this backend."""
+    raise ValidationError(f"Unknown validator type: {type(validator)}")
 
 
 def _get_invalid_samples(series: "pl.Series", invalid_mask: "pl.Series") -> tuple[list[tuple], int]:
@@ -66,10 +76,12 @@ def _get_invalid_samples(series: "pl.Series", invalid_mask: "pl.Series") -> tupl
 
 def _validate_range(series: "pl.Series", validator: Range, col_name: str) -> None:
     """Validate that all values in series are within the specified range."""
-    invalid_mask = (series < validator.min) | (series > validator.max)
-    if not invalid_mask.any():
+    # Two reductions decide the common all-valid case without allocating boolean masks
+    col_min, col_max = series.min(), series.max()
+    if col_min is None or (col_min >= validator.min and col_max <= validator.max):
         return
 
+    invalid_mask = (series < validator.min) | (series > validator.max)
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(
         col_name,
@@ -80,7 +92,7 @@ def _validate_range(series: "pl.Series", validator: Range, col_name: str) -> Non
     )
 
 
-def _validate_unique(series: "pl.Series", col_name: str) -> None:
+def _validate_unique(series: "pl.Series", validator: Unique, col_name: str) -> None:
     """Validate that all values in series are unique (no duplicates)."""
     duplicated_mask = series.is_duplicated()
     if not duplicated_mask.any():
@@ -160,3 +172,14 @@ def _validate_custom(series: "pl.Series", validator: Custom, col_name: str) -> N
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(col_name, validator.message, samples, total_invalid)
+
+
+_VALIDATOR_HANDLERS: dict[type, Callable[[Any, Any, str], None]] = {
+    Range: _validate_range,
+    Unique: _validate_unique,
+    In: _validate_in,
+    Regex: _validate_regex,
+    MinLen: _validate_minlen,
+    MaxLen: _validate_maxlen,
+    Custom: _validate_custom,
+}
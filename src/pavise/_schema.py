@@ -0,0 +1,94 @@
+"""Backend-agnostic helpers for resolving and decomposing schema annotations."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Annotated, Any, Union, get_args, get_origin, get_type_hints
+
+from pavise.types import NotRequiredColumn
+
+
+@cache
+def get_schema_type_hints(schema: type) -> dict[str, Any]:
+    """
+    Resolve the column annotations of a schema, caching the result per schema class.
+
+    Schemas annotated only with plain classes (``a: int``) are read straight from
+    ``__annotations__``; string annotations and typing special forms (Optional,
+    Annotated, Literal, ...) go through ``typing.get_type_hints``.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        schema: Schema Protocol class
+
+    Returns:
+        Dict mapping column_name -> annotation (Annotated metadata is preserved)
+    """
+    annotations = _collect_class_annotations(schema)
+    if annotations and all(_is_plain_class(annotation) for annotation in annotations.values()):
+        return annotations
+    return get_type_hints(schema, include_extras=True)
+
+
+def _collect_class_annotations(schema: type) -> dict[str, Any]:
+    """Merge the raw annotations of schema and its bases, base classes first."""
+    annotations: dict[str, Any] = {}
+    for base in reversed(schema.__mro__):
+        annotations.update(base.__dict__.get("__annotations__", {}))
+    return annotations
+
+
+def _is_plain_class(annotation: Any) -> bool:
+    """Check if an annotation is a class that needs no resolution by get_type_hints."""
+    return isinstance(annotation, type) and get_origin(annotation) is None
+
+
+def extract_type_and_validators(annotation: type) -> tuple[type, list, bool, bool]:
+    """
+    Extract base type, validators, nullable flag, and not-required flag from a type annotation.
+
+    Args:
+        annotation: Type annotation (e.g., int, Optional[int], NotRequiredColumn[int],
+            or Annotated[int, Range(0, 100)])
+
+    Returns:
+        Tuple of (base_type, validators, is_optional, is_not_required)
+        - For Annotated[int, Range(0, 100)]: (int, [Range(0, 100)], False, False)
+        - For int: (int, [], False, False)
+        - For Optional[int]: (int, [], True, False)
+        - For NotRequiredColumn[int]: (int, [], False, True)
+        - For NotRequiredColumn[Optional[int]]: (int, [], True, True)
+    """
+    validators = []
+    is_optional = False
+    is_not_required = False
+
+    if isinstance(annotation, type) and issubclass(annotation, NotRequiredColumn):
+        is_not_required = True
+        annotation = getattr(annotation, "_inner_type", annotation)
+
+    if get_origin(annotation) is Annotated:
+        args = get_args(annotation)
+        base_type = args[0]
+        validators = list(args[1:])
+        annotation = base_type
+
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = get_args(annotation)
+        if len(args) == 2 and type(None) in args:
+            is_optional = True
+            base_type = args[0] if args[1] is type(None) else args[1]
+            return base_type, validators, is_optional, is_not_required
+
+    return annotation, validators, is_optional, is_not_required
+
+
+def get_required_columns(type_hints: dict[str, Any]) -> tuple[str, ...]:
+    """Get the schema columns that must be present (all but NotRequiredColumn), in order."""
+    return tuple(
+        col_name
+        for col_name, col_type in type_hints.items()
+        if not (isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn))
+    )
@@ -1,12 +1,14 @@
 """Pandas backend for type-parameterized DataFrame with Protocol-based schema validation."""
 
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, ClassVar, Generic, Optional, TypeVar
 
 import pandas as pd
 
+from pavise._config import VALIDATE_ENABLED
 from pavise._pandas.spec import get_column_specs
 from pavise._pandas.testing import build_for_test_dataframe, convert_data_to_dict
-from pavise._pandas.validation import validate_dataframe
+from pavise._pandas.validation import SchemaValidator, build_schema_validator
+from pavise._schema import get_schema_type_hints
 from pavise.types import NotRequiredColumn
 
 __all__ = ["DataFrame", "NotRequiredColumn"]
@@ -33,20 +35,55 @@ class DataFrame(pd.DataFrame, Generic[SchemaT_co]):
     """
 
     _schema: Optional[type] = None
+    _schema_hints: Optional[dict[str, Any]] = None
+    _validate: Optional[SchemaValidator] = None
+    _typed_cls_cache: ClassVar[dict[Any, type]] = {}
 
     def __class_getitem__(cls, schema: type):
-        """Create a new DataFrame class with schema validation."""
+        """Return the DataFrame class with schema validation, creating it once per schema."""
+        typed_cls = cls._typed_cls_cache.get(schema)
+        if typed_cls is None:
 
-        class TypedDataFrame(DataFrame):
-            _schema = schema
+            class TypedDataFrame(DataFrame):
+                _schema = schema
 
-        return TypedDataFrame
+            typed_cls = cls._typed_cls_cache[schema] = TypedDataFrame
 
-    def __new__(cls, data: Any = None, *args: Any, strict: bool = False, **kwargs: Any):
+        return typed_cls
+
+    @classmethod
+    def _get_validator(cls) -> Optional[SchemaValidator]:
+        """
+        Get the validator of the schema, building it on first use.
+
+        Annotations are resolved here rather than in __class_getitem__, so that
+        DataFrame[T] with a TypeVar, a string or a not-yet-defined forward reference can
+        still be used in annotations.
+        """
+        if cls._validate is None and cls._schema is not None:
+            cls._schema_hints = get_schema_type_hints(cls._schema)
+            cls._validate = staticmethod(build_schema_validator(cls._schema_hints))
+        return cls._validate
+
+    def __new__(
+        cls,
+        data: Any = None,
+        *args: Any,
+        strict: bool = False,
+        validate: bool = True,
+        **kwargs: Any,
+    ):
         """Create a new DataFrame instance."""
         return super().__new__(cls)
 
-    def __init__(self, data: Any = None, *args: Any, strict: bool = False, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        data: Any = None,
+        *args: Any,
+        strict: bool = False,
+        validate: bool = True,
+        **kwargs: Any,
+    ) -> None:
         """
         Initialize DataFrame with optional schema validation.
 
@@ -54,6 +91,8 @@ class DataFrame(pd.DataFrame, Generic[SchemaT_co]):
             data: Data to create DataFrame from
             *args: Additional arguments passed to pd.DataFrame
             strict: If True, raise error on extra columns not in schema
+            validate: If False, skip schema validation (e.g. for already trusted data).
+                Validation can also be disabled globally with PAVISE_VALIDATE=0.
             **kwargs: Additional keyword arguments passed to pd.DataFrame
 
         Raises:
@@ -61,8 +100,9 @@ class DataFrame(pd.DataFrame, Generic[SchemaT_co]):
             TypeError: If column has wrong type
         """
         pd.DataFrame.__init__(self, data, *args, **kwargs)  # type: ignore[misc]
-        if self._schema is not None:
-            validate_dataframe(self, self._schema, strict=strict)
+        validator = self._get_validator() if validate and VALIDATE_ENABLED else None
+        if validator is not None:
+            validator(self, strict)
 
     @classmethod
     def make_empty(cls) -> "DataFrame[SchemaT_co]":
@@ -1,15 +1,22 @@
 """Polars backend for type-parameterized DataFrame with Protocol-based schema validation."""
 
-from typing import Generic, Optional, TypeVar
+from typing import Any, ClassVar, Generic, Optional, TypeVar
 
 try:
     import polars as pl
 except ImportError:
     raise ImportError("Polars is not installed. Install it with: pip install pavise[polars]")
 
+from pavise._config import VALIDATE_ENABLED
 from pavise._polars.spec import get_column_specs
 from pavise._polars.testing import build_for_test_dataframe, convert_data_to_dict
-from pavise._polars.validation import validate_dataframe
+from pavise._polars.validation import (
+    SchemaValidator,
+    build_schema_validator,
+    has_only_dtype_checks,
+)
+from pavise._schema import get_required_columns, get_schema_type_hints
+from pavise.exceptions import ValidationError
 from pavise.types import NotRequiredColumn
 
 __all__ = ["DataFrame", "NotRequiredColumn"]
@@ -36,32 +43,114 @@ class DataFrame(pl.DataFrame, Generic[SchemaT_co]):
     """
 
     _schema: Optional[type] = None
+    _schema_hints: Optional[dict[str, Any]] = None
+    _validate: Optional[SchemaValidator] = None
+    _required_cols: tuple[str, ...] = ()
+    _dtype_only: bool = False
+    _typed_cls_cache: ClassVar[dict[Any, type]] = {}
+    # (strict, width, schema column dtypes) recorded when this instance passed a dtype-only
+    # validation
+    _validated_as: Optional[tuple[bool, int, tuple[Any, ...]]] = None
 
     def __class_getitem__(cls, schema: type):
-        """Create a new DataFrame class with schema validation."""
+        """Return the DataFrame class with schema validation, creating it once per schema."""
+        typed_cls = cls._typed_cls_cache.get(schema)
+        if typed_cls is None:
 
-        class TypedDataFrame(DataFrame):
-            _schema = schema
+            class TypedDataFrame(DataFrame):
+                _schema = schema
 
-        return TypedDataFrame
+            typed_cls = cls._typed_cls_cache[schema] = TypedDataFrame
 
-    def __init__(self, data, *args, strict=False, **kwargs):
+        return typed_cls
+
+    @classmethod
+    def _get_validator(cls) -> Optional[SchemaValidator]:
+        """
+        Get the validator of the schema, building it on first use.
+
+        Annotations are resolved here rather than in __class_getitem__, so that
+        DataFrame[T] with a TypeVar, a string or a not-yet-defined forward reference can
+        still be used in annotations.
+        """
+        if cls._validate is None and cls._schema is not None:
+            cls._schema_hints = get_schema_type_hints(cls._schema)
+            cls._validate = staticmethod(build_schema_validator(cls._schema_hints))
+            cls._required_cols = get_required_columns(cls._schema_hints)
+            cls._dtype_only = has_only_dtype_checks(cls._schema_hints)
+        return cls._validate
+
+    def __init__(self, data, *args, strict=False, validate=True, **kwargs):
         """
         Initialize DataFrame with optional schema validation.
 
+        A DataFrame that already passed validation for the same schema is passed through
+        without validating it again, if its dtypes are unchanged and the schema only checks
+        dtypes (so in-place changes to values cannot have invalidated it).
+        A dict missing a required column is rejected before it is converted.
+
         Args:
             data: Data to create DataFrame from (pl.DataFrame or dict/list)
             *args: Additional arguments passed to pl.DataFrame
             strict: If True, raise error on extra columns not in schema
+            validate: If False, skip schema validation (e.g. for already trusted data).
+                Validation can also be disabled globally with PAVISE_VALIDATE=0.
             **kwargs: Additional keyword arguments passed to pl.DataFrame
 
         Raises:
             ValueError: If required column is missing
             TypeError: If column has wrong type
         """
+        validator = self._get_validator() if validate and VALIDATE_ENABLED else None
+        # Extra arguments such as schema= can rename columns, so only check plain dicts
+        if validator is not None and isinstance(data, dict) and not args and not kwargs:
+            for col_name in self._required_cols:
+                if col_name not in data:
+                    raise ValidationError("missing", column_name=col_name)
+
         pl.DataFrame.__init__(self, data, *args, **kwargs)  # type: ignore[misc]
-        if self._schema is not None:
-            validate_dataframe(self, self._schema, strict=strict)
+        if validator is None:
+            return
+
+        if type(data) is type(self) and not args and not kwargs and data._is_validated(strict):
+            self._validated_as = data._validated_as
+            return
+
+        validator(self, strict)
+        if not (self._dtype_only and self.height > 0):
+            return
+        # Empty and Object (ANY placeholder) columns skip the dtype check, so their later
+        # in-place changes would go unnoticed; only remember fully dtype-checked frames
+        dtypes = self._schema_dtypes()
+        if not any(dtype is not None and dtype.base_type() is pl.Object for dtype in dtypes):
+            self._validated_as = (strict, self.width, dtypes)
+
+    def _is_validated(self, strict: bool) -> bool:
+        """Check if this instance passed validation at least as strict and kept its dtypes."""
+        if self._validated_as is None:
+            return False
+        validated_strict, width, dtypes = self._validated_as
+        return (
+            (validated_strict or not strict)
+            and self.width == width
+            and self._schema_dtypes() == dtypes
+        )
+
+    def _schema_dtypes(self) -> tuple[Optional[pl.DataType], ...]:
+        """
+        Get the dtypes of the schema columns, None for absent ones.
+
+        Unlike self.schema, this reads only the schema's own columns, so it stays cheap on
+        wide frames. Together with the frame width it detects added, removed, renamed and
+        retyped columns.
+        """
+        dtypes = []
+        for col_name in self._schema_hints or ():
+            try:
+                dtypes.append(self.get_column(col_name).dtype)
+            except pl.exceptions.ColumnNotFoundError:
+                dtypes.append(None)
+        return tuple(dtypes)
 
     @classmethod
     def make_empty(cls) -> "DataFrame[SchemaT_co]":
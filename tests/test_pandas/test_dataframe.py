@@ -1,5 +1,8 @@
+import os
+import subprocess
+import sys
 from datetime import date, datetime, timedelta
-from typing import Annotated, Literal, Optional, Protocol
+from typing import Annotated, Literal, Optional, Protocol, TypeVar
 
 import pandas as pd
 import pytest
@@ -56,6 +59,12 @@ def test_dataframe_class_getitem_returns_class():
     assert isinstance(type_of, type)
 
 
+def test_dataframe_class_getitem_returns_same_class_for_same_schema():
+    """DataFrame[Schema] returns the same class on repeated calls"""
+    assert DataFrame[SimpleSchema] is DataFrame[SimpleSchema]
+    assert DataFrame[SimpleSchema] is not DataFrame[MultiTypeSchema]
+
+
 def test_dataframe_with_schema_validates_correct_dataframe():
     """DataFrame[Schema](df) passes validation for correct DataFrame"""
     df = pd.DataFrame({"a": [1, 2, 3]})
@@ -71,6 +80,104 @@ def test_dataframe_with_schema_raises_on_missing_column():
         DataFrame[SimpleSchema](df)
 
 
+def test_dataframe_class_getitem_does_not_resolve_schema():
+    """DataFrame[...] accepts TypeVars, strings and unresolved forward references"""
+    T = TypeVar("T")
+
+    class ForwardRefSchema(Protocol):
+        a: "UndefinedType"  # noqa: F821
+
+    DataFrame[T]
+    DataFrame["UserSchema"]
+    DataFrame[ForwardRefSchema]
+    with pytest.raises(NameError):
+        DataFrame[ForwardRefSchema](pd.DataFrame({"a": [1]}))
+
+
+def test_dataframe_with_inherited_schema_validates_parent_columns():
+    """DataFrame[Schema](df) validates columns declared on parent schemas"""
+
+    class ChildSchema(SimpleSchema, Protocol):
+        b: str
+
+    DataFrame[ChildSchema](pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    with pytest.raises(ValidationError, match="Column 'a': missing"):
+        DataFrame[ChildSchema](pd.DataFrame({"b": ["x", "y"]}))
+
+
+def test_dataframe_with_plain_class_schema():
+    """DataFrame[Schema](df) accepts schemas that are plain annotated classes"""
+
+    class PlainSchema:
+        a: int
+        b: Optional[str]
+
+    DataFrame[PlainSchema](pd.DataFrame({"a": [1, 2], "b": ["x", None]}))
+    with pytest.raises(ValidationError, match="Column 'a': expected int"):
+        DataFrame[PlainSchema](pd.DataFrame({"a": ["x", "y"], "b": ["x", None]}))
+
+
+def test_dataframe_reports_missing_column_before_type_errors():
+    """DataFrame[Schema](df) checks column presence before column types"""
+    df = pd.DataFrame({"int_col": ["x"], "float_col": [1.0], "bool_col": [True]})
+    with pytest.raises(ValidationError, match="Column 'str_col': missing"):
+        DataFrame[MultiTypeSchema](df)
+
+
+def test_dataframe_revalidates_object_columns_by_value():
+    """DataFrame[Schema](df) checks the values of object columns on every validation"""
+
+    class StrSchema(Protocol):
+        s: str
+
+    DataFrame[StrSchema](pd.DataFrame({"s": ["x", "y"]}))
+    with pytest.raises(ValidationError, match="Column 's': expected str"):
+        DataFrame[StrSchema](pd.DataFrame({"s": ["x", 1]}))
+
+
+def test_dataframe_validate_false_skips_validation():
+    """DataFrame[Schema](df, validate=False) skips validation"""
+    df = pd.DataFrame({"b": [1, 2, 3]})
+    result = DataFrame[SimpleSchema](df, validate=False)
+    assert isinstance(result, DataFrame[SimpleSchema])
+
+
+@pytest.mark.parametrize(
+    ("value", "enabled"),
+    [("0", False), ("false", False), ("no", False), (" OFF ", False), ("1", True), ("", True)],
+)
+def test_dataframe_validation_controlled_by_environment_variable(value, enabled):
+    """PAVISE_VALIDATE read at import time turns validation on or off"""
+    code = (
+        "from typing import Protocol\n"
+        "import pandas as pd\n"
+        "from pavise.exceptions import ValidationError\n"
+        "from pavise.pandas import DataFrame\n"
+        "class Schema(Protocol):\n"
+        "    a: int\n"
+        "try:\n"
+        "    DataFrame[Schema](pd.DataFrame({'b': [1]}))\n"
+        "except ValidationError:\n"
+        "    print('validated')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PAVISE_VALIDATE": value},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert (result.stdout.strip() == "validated") is enabled
+
+
+def test_dataframe_validation_disabled_globally(monkeypatch):
+    """DataFrame[Schema](df) skips validation when disabled by PAVISE_VALIDATE"""
+    monkeypatch.setattr("pavise.pandas.VALIDATE_ENABLED", False)
+    df = pd.DataFrame({"b": [1, 2, 3]})
+    result = DataFrame[SimpleSchema](df)
+    assert isinstance(result, DataFrame[SimpleSchema])
+
+
 def test_dataframe_with_schema_raises_on_wrong_type():
     """DataFrame[Schema](df) raises error for wrong type"""
     df = pd.DataFrame({"a": ["x", "y", "z"]})
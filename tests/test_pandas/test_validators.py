@@ -1,4 +1,4 @@
-from typing import Annotated, Protocol
+from typing import Annotated, Optional, Protocol
 
 import pandas as pd
 import pytest
@@ -12,6 +12,10 @@ class AgeSchema(Protocol):
     age: Annotated[int, Range(0, 150)]
 
 
+class ScoreSchema(Protocol):
+    score: Annotated[Optional[float], Range(0, 1)]
+
+
 class UserIdSchema(Protocol):
     user_id: Annotated[int, Unique()]
 
@@ -53,6 +57,48 @@ def test_range_validator_rejects_values_above_maximum():
         DataFrame[AgeSchema](df)
 
 
+def test_range_validator_checks_large_columns():
+    """Range validator checks large columns"""
+    ages = [30] * 200_000
+    DataFrame[AgeSchema](pd.DataFrame({"age": ages}))
+
+    ages[-1] = 200
+    with pytest.raises(ValidationError, match="age.*range"):
+        DataFrame[AgeSchema](pd.DataFrame({"age": ages}))
+
+
+def test_range_validator_compares_large_int_values_exactly():
+    """Range validator detects int64 values just beyond bounds that float64 cannot represent"""
+
+    class IdSchema(Protocol):
+        id: Annotated[int, Range(0, 2**62)]
+
+    DataFrame[IdSchema](pd.DataFrame({"id": [2**62] * 200_000}))
+    with pytest.raises(ValidationError, match="id.*range"):
+        DataFrame[IdSchema](pd.DataFrame({"id": [2**62 + 1] * 200_000}))
+
+
+def test_range_validator_ignores_nan_values():
+    """Range validator skips NaN values in nullable float columns"""
+    df = pd.DataFrame({"score": [float("nan"), 0.5, 1.0]})
+    result = DataFrame[ScoreSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_range_validator_rejects_out_of_range_values_alongside_nan():
+    """Range validator rejects out-of-range values in float columns that contain NaN"""
+    df = pd.DataFrame({"score": [float("nan"), 0.5, 2.0]})
+    with pytest.raises(ValidationError, match="score.*range"):
+        DataFrame[ScoreSchema](df)
+
+
+def test_range_validator_accepts_all_nan_column():
+    """Range validator accepts float columns containing only NaN"""
+    df = pd.DataFrame({"score": [float("nan"), float("nan")]})
+    result = DataFrame[ScoreSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
 def test_unique_validator_accepts_unique_values():
     """Unique validator accepts columns with all unique values"""
     df = pd.DataFrame({"user_id": [1, 2, 3, 4]})
@@ -1,5 +1,8 @@
+import os
+import subprocess
+import sys
 from datetime import date, datetime, timedelta
-from typing import Annotated, Literal, Optional, Protocol
+from typing import Annotated, Literal, Optional, Protocol, TypeVar
 
 import pytest
 
@@ -60,6 +63,12 @@ def test_dataframe_class_getitem_returns_class():
     assert isinstance(type_of, type)
 
 
+def test_dataframe_class_getitem_returns_same_class_for_same_schema():
+    """DataFrame[Schema] returns the same class on repeated calls"""
+    assert DataFrame[SimpleSchema] is DataFrame[SimpleSchema]
+    assert DataFrame[SimpleSchema] is not DataFrame[MultiTypeSchema]
+
+
 def test_dataframe_with_schema_validates_correct_dataframe():
     """DataFrame[Schema](df) passes validation for correct DataFrame"""
     df = pl.DataFrame({"a": [1, 2, 3]})
@@ -75,6 +84,185 @@ def test_dataframe_with_schema_raises_on_missing_column():
         DataFrame[SimpleSchema](df)
 
 
+def test_dataframe_class_getitem_does_not_resolve_schema():
+    """DataFrame[...] accepts TypeVars, strings and unresolved forward references"""
+    T = TypeVar("T")
+
+    class ForwardRefSchema(Protocol):
+        a: "UndefinedType"  # noqa: F821
+
+    DataFrame[T]
+    DataFrame["UserSchema"]
+    DataFrame[ForwardRefSchema]
+    with pytest.raises(NameError):
+        DataFrame[ForwardRefSchema](pl.DataFrame({"a": [1]}))
+
+
+def test_dataframe_with_inherited_schema_validates_parent_columns():
+    """DataFrame[Schema](df) validates columns declared on parent schemas"""
+
+    class ChildSchema(SimpleSchema, Protocol):
+        b: str
+
+    DataFrame[ChildSchema](pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+    with pytest.raises(ValidationError, match="Column 'a': missing"):
+        DataFrame[ChildSchema](pl.DataFrame({"b": ["x", "y"]}))
+
+
+def test_dataframe_with_plain_class_schema():
+    """DataFrame[Schema](df) accepts schemas that are plain annotated classes"""
+
+    class PlainSchema:
+        a: int
+        b: Optional[str]
+
+    DataFrame[PlainSchema](pl.DataFrame({"a": [1, 2], "b": ["x", None]}))
+    with pytest.raises(ValidationError, match="Column 'a': expected int"):
+        DataFrame[PlainSchema](pl.DataFrame({"a": ["x", "y"], "b": ["x", None]}))
+
+
+def test_dataframe_reports_missing_column_before_type_errors():
+    """DataFrame[Schema](df) checks column presence before column types"""
+    df = pl.DataFrame({"int_col": ["x"], "float_col": [1.0], "bool_col": [True]})
+    with pytest.raises(ValidationError, match="Column 'str_col': missing"):
+        DataFrame[MultiTypeSchema](df)
+
+
+def test_dataframe_from_dict_reports_missing_column_before_conversion():
+    """DataFrame[Schema](dict) rejects a missing column before building the DataFrame"""
+    # Mixed values in "b" would make polars itself raise if the dict were converted
+    with pytest.raises(ValidationError, match="Column 'a': missing"):
+        DataFrame[SimpleSchema]({"b": [1, "x"]})
+
+
+def test_dataframe_validate_false_skips_validation():
+    """DataFrame[Schema](df, validate=False) skips validation"""
+    df = pl.DataFrame({"b": [1, 2, 3]})
+    result = DataFrame[SimpleSchema](df, validate=False)
+    assert isinstance(result, DataFrame[SimpleSchema])
+
+
+@pytest.mark.parametrize(
+    ("value", "enabled"),
+    [("0", False), ("false", False), ("no", False), (" OFF ", False), ("1", True), ("", True)],
+)
+def test_dataframe_validation_controlled_by_environment_variable(value, enabled):
+    """PAVISE_VALIDATE read at import time turns validation on or off"""
+    code = (
+        "from typing import Protocol\n"
+        "import polars as pl\n"
+        "from pavise.exceptions import ValidationError\n"
+        "from pavise.polars import DataFrame\n"
+        "class Schema(Protocol):\n"
+        "    a: int\n"
+        "try:\n"
+        "    DataFrame[Schema](pl.DataFrame({'b': [1]}))\n"
+        "except ValidationError:\n"
+        "    print('validated')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PAVISE_VALIDATE": value},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert (result.stdout.strip() == "validated") is enabled
+
+
+def test_dataframe_validation_disabled_globally(monkeypatch):
+    """DataFrame[Schema](df) skips validation when disabled by PAVISE_VALIDATE"""
+    monkeypatch.setattr("pavise.polars.VALIDATE_ENABLED", False)
+    df = pl.DataFrame({"b": [1, 2, 3]})
+    result = DataFrame[SimpleSchema](df)
+    assert isinstance(result, DataFrame[SimpleSchema])
+
+
+def test_dataframe_skips_revalidation_of_validated_dataframe(monkeypatch):
+    """DataFrame[Schema](validated) does not validate again when the schema only checks dtypes"""
+
+    class NullableSchema(Protocol):
+        a: Optional[int]
+
+    validated = DataFrame[NullableSchema](pl.DataFrame({"a": [1, None, 3]}))
+
+    def fail(df, strict):
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr(DataFrame[NullableSchema], "_validate", staticmethod(fail))
+    result = DataFrame[NullableSchema](validated)
+    assert result.equals(validated)
+    with pytest.raises(AssertionError, match="validated again"):
+        DataFrame[NullableSchema](validated, strict=True)
+
+
+def test_dataframe_revalidates_dataframe_mutated_in_place():
+    """DataFrame[Schema](validated) validates again when value-level checks may be stale"""
+
+    class ValueCheckedSchema(Protocol):
+        age: Annotated[int, Range(0, 150)]
+        user_id: Annotated[int, Unique()]
+        score: int
+
+    validated = DataFrame[ValueCheckedSchema](
+        pl.DataFrame({"age": [20, 30], "user_id": [1, 2], "score": [1, 2]})
+    )
+    validated[0, "age"] = -5
+    with pytest.raises(ValidationError, match="Column 'age'"):
+        DataFrame[ValueCheckedSchema](validated)
+
+    validated = DataFrame[ValueCheckedSchema](
+        pl.DataFrame({"age": [20, 30], "user_id": [1, 2], "score": [1, 2]})
+    )
+    validated.extend(pl.DataFrame({"age": [40], "user_id": [1], "score": [3]}))
+    with pytest.raises(ValidationError, match="Column 'user_id'"):
+        DataFrame[ValueCheckedSchema](validated)
+
+    validated = DataFrame[ValueCheckedSchema](
+        pl.DataFrame({"age": [20, 30], "user_id": [1, 2], "score": [1, 2]})
+    )
+    validated.extend(
+        pl.DataFrame(
+            {"age": [40], "user_id": [3], "score": [None]},
+            schema={"age": pl.Int64, "user_id": pl.Int64, "score": pl.Int64},
+        )
+    )
+    with pytest.raises(ValidationError, match="Column 'score'"):
+        DataFrame[ValueCheckedSchema](validated)
+
+
+def test_dataframe_revalidates_dataframe_validated_while_empty():
+    """DataFrame[Schema](validated) validates again if the dtype check was skipped as empty"""
+
+    class NullableSchema(Protocol):
+        a: Optional[int]
+
+    validated = DataFrame[NullableSchema](pl.DataFrame({"a": []}, schema={"a": pl.Utf8}))
+    validated.extend(pl.DataFrame({"a": ["x"]}))
+    with pytest.raises(ValidationError, match="Column 'a': expected int"):
+        DataFrame[NullableSchema](validated)
+
+
+def test_dataframe_revalidates_dataframe_with_column_inserted_in_place():
+    """DataFrame[Schema](validated) validates again after a schema column is added in place"""
+
+    class NullableSchema(Protocol):
+        a: Optional[int]
+        b: NotRequiredColumn[Optional[int]]
+
+    validated = DataFrame[NullableSchema](pl.DataFrame({"a": [1, 2]}))
+    validated.insert_column(1, pl.Series("b", ["x", "y"]))
+    with pytest.raises(ValidationError, match="Column 'b': expected int"):
+        DataFrame[NullableSchema](validated)
+
+
+def test_dataframe_validates_unvalidated_typed_dataframe():
+    """DataFrame[Schema](df) validates a typed frame created with validate=False"""
+    unvalidated = DataFrame[SimpleSchema](pl.DataFrame({"b": [1, 2, 3]}), validate=False)
+    with pytest.raises(ValidationError, match="Column 'a': missing"):
+        DataFrame[SimpleSchema](unvalidated)
+
+
 def test_dataframe_with_schema_raises_on_wrong_type():
     """DataFrame[Schema](df) raises error for wrong type"""
     df = pl.DataFrame({"a": ["x", "y", "z"]})
@@ -134,6 +322,31 @@ def test_dataframe_datetime_type_raises_on_wrong_type():
         DataFrame[DatetimeSchema](df)
 
 
+def test_dataframe_datetime_type_accepts_any_time_unit_and_zone():
+    """Datetime columns with any time unit or time zone match datetime"""
+    df = pl.DataFrame(
+        {
+            "created_at": pl.Series([datetime(2024, 1, 1)], dtype=pl.Datetime("ms", "UTC")),
+            "event_date": [date(2024, 1, 1)],
+            "duration": [timedelta(days=1)],
+        }
+    )
+    DataFrame[DatetimeSchema](df)
+
+
+def test_dataframe_datetime_type_raises_on_duration():
+    """DataFrame raises error when datetime column holds durations"""
+    df = pl.DataFrame(
+        {
+            "created_at": [timedelta(days=1)],
+            "event_date": [date(2024, 1, 1)],
+            "duration": [timedelta(days=1)],
+        }
+    )
+    with pytest.raises(ValidationError, match="Column 'created_at': expected datetime"):
+        DataFrame[DatetimeSchema](df)
+
+
 def test_dataframe_date_type_raises_on_wrong_type():
     """DataFrame raises error when date column has wrong type"""
     df = pl.DataFrame(
@@ -424,3 +637,18 @@ def test_empty_creates_empty_dataframe_with_datetime_types():
         }
     )
     assert result.equals(expected)
+
+
+def test_import_does_not_load_pandas():
+    """Test that the polars backend can be imported and used without importing pandas"""
+    code = (
+        "import sys\n"
+        "from typing import Protocol\n"
+        "import polars as pl\n"
+        "from pavise.polars import DataFrame\n"
+        "class Schema(Protocol):\n"
+        "    a: int\n"
+        "DataFrame[Schema](pl.DataFrame({'a': [1, 2, 3]}))\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,4 +1,4 @@
-from typing import Annotated, Protocol
+from typing import Annotated, Optional, Protocol
 
 import polars as pl
 import pytest
@@ -53,6 +53,26 @@ def test_range_validator_rejects_values_above_maximum():
         DataFrame[AgeSchema](df)
 
 
+def test_range_validator_ignores_null_values():
+    """Range validator skips nulls, including in all-null columns"""
+
+    class OptionalAgeSchema(Protocol):
+        age: Annotated[Optional[int], Range(0, 150)]
+
+    DataFrame[OptionalAgeSchema](pl.DataFrame({"age": [None, 30]}))
+    DataFrame[OptionalAgeSchema](pl.DataFrame({"age": [None, None]}, schema={"age": pl.Int64}))
+    with pytest.raises(ValidationError, match="age.*range"):
+        DataFrame[OptionalAgeSchema](pl.DataFrame({"age": [None, 200]}))
+
+
+def test_range_validator_handles_column_names_with_regex_characters():
+    """Range validator does not treat column names as patterns"""
+    schema = type("Schema", (), {"__annotations__": {"^a$": Annotated[int, Range(0, 10)]}})
+    DataFrame[schema](pl.DataFrame({"^a$": [1, 2]}))
+    with pytest.raises(ValidationError, match="range"):
+        DataFrame[schema](pl.DataFrame({"^a$": [1, 20]}))
+
+
 def test_unique_validator_accepts_unique_values():
     """Unique validator accepts columns with all unique values"""
     df = pl.DataFrame({"user_id": [1, 2, 3, 4]})